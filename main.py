@@ -1,20 +1,36 @@
 import typing
 import sys
 import argparse
+import atexit
 import logging
+import logging.handlers
+import queue
 
 __APP_DESCRIPTION__ = "A simple CLI tool."
 
 if __name__ == "__main__":
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler("app.log"),
-        ],
+    # handlers do their I/O on the listener thread so callers never block on it
+    log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(log_formatter)
+    file_handler = logging.handlers.RotatingFileHandler(
+        "app.log", maxBytes=50_000_000, backupCount=5
     )
+    file_handler.setFormatter(log_formatter)
+
+    log_queue = queue.Queue(-1)
+    log_listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, file_handler, respect_handler_level=True
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+    # attached directly so the QueueHandler keeps the bare %(message)s formatter
+    # and the prefix is added once, by the listener handlers
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     parser = argparse.ArgumentParser(description=__APP_DESCRIPTION__)
 
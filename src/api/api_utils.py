@@ -4,15 +4,33 @@ import logging
 import pytz
 import config
 
+if typing.TYPE_CHECKING:
+    # annotation only; importing cloud_api at runtime builds the HTTP client
+    from src.api.cloud_api import ApiResponse
 
-def cache_fetch_by_id(cache_key: str, target_id, cache: typing.Dict):
+
+_log = logging.getLogger(__name__)
+
+# common success_codes for handle_response
+SUCCESS_2XX = frozenset(range(200, 300))
+SUCCESS_GET = frozenset({200})
+
+# bytes of a failed response body included in the error log
+_LOGGED_BODY_LIMIT = 1000
+
+# pytz.timezone() parses the zoneinfo file, so resolve once
+_TZ_UTC = pytz.utc
+_TZ_LOCAL = pytz.timezone(config.LOCAL_TIMEZONE)  # Replace with your local timezone
+
+
+def cache_fetch_by_id(cache_key: str, target_id, cache: typing.MutableMapping):
     """
     Fetches an item from the cache by its ID.
 
     Args:
         cache_key (str): The key under which the item is stored in the cache.
         target_id: The ID of the item to fetch.
-        cache (typing.Dict): The cache dictionary.
+        cache (typing.MutableMapping): The cache mapping.
 
     Returns:
         The item if found, otherwise None.
@@ -22,22 +40,24 @@ def cache_fetch_by_id(cache_key: str, target_id, cache: typing.Dict):
     return None
 
 
-def cache_object_by_id(cache_key: str, cache: typing.Dict, objects: typing.List):
+def cache_object_by_id(
+    cache_key: str, cache: typing.MutableMapping, objects: typing.Iterable
+):
     """
-    Caches a list of objects by their IDs.
+    Caches objects by their IDs.
+    objects can be any iterable, e.g. ApiResponse.iter_data() to avoid building the full list.
 
     Args:
         cache_key (str): The key under which to store the objects in the cache.
-        cache (typing.Dict): The cache dictionary.
-        objects (typing.List): The list of objects to cache.
+        cache (typing.MutableMapping): The cache mapping.
+        objects (typing.Iterable): The objects to cache.
 
     Returns:
         None
     """
-    if cache_key not in cache:
-        cache[cache_key] = {}
+    bucket = cache.setdefault(cache_key, {})
     for obj in objects:
-        cache[cache_key][obj.id] = obj
+        bucket[obj.id] = obj
 
 
 def posix_timestamp_to_localtime(posix_timestamp: int) -> datetime.datetime:
@@ -50,43 +70,46 @@ def posix_timestamp_to_localtime(posix_timestamp: int) -> datetime.datetime:
     Returns:
         datetime.datetime: The local time.
     """
-    tz_utc = pytz.utc
-    tz_local = pytz.timezone(config.LOCAL_TIMEZONE)  # Replace with your local timezone
-    return datetime.datetime.fromtimestamp(posix_timestamp, tz_utc).astimezone(tz_local)
+    return datetime.datetime.fromtimestamp(posix_timestamp, _TZ_UTC).astimezone(
+        _TZ_LOCAL
+    )
 
 
 def handle_response(
-    response: typing.Dict,
+    response: "ApiResponse",
     action_description: str,
-    http_method: str,
-    success_codes: typing.List[int],
-) -> typing.Dict[int, str]:
+    success_codes: typing.Collection[int],
+) -> bool:
     """
     Handles the API response.
 
     Args:
-        response (typing.Dict): The API response.
-        response_code (int): The HTTP response code.
-        response_body (str): The HTTP response body.
-        cache_key (str): The key under which to store the objects in the cache.
-        cache (typing.Dict): The cache dictionary.
+        response (ApiResponse): The API response.
+        action_description (str): A description of the action, used in log messages.
+        success_codes (typing.Collection[int]): The HTTP response codes treated as success,
+            ideally a set such as SUCCESS_2XX or SUCCESS_GET.
 
     Returns:
-        None or the object if found.
+        bool: True if the response code is a success code, False otherwise.
     """
-    response_code = (
-        response.response_code if hasattr(response, "response_code") else response_code
-    )
+    if not isinstance(success_codes, (frozenset, set)):
+        success_codes = frozenset(success_codes)
+    response_code = response.response_code
     if response_code in success_codes:
-        logging.info(
-            f"Action '{action_description}' completed successfully with response code {response_code}."
+        if _log.isEnabledFor(logging.INFO):
+            _log.info(
+                "Action '%s' completed successfully with response code %d.",
+                action_description,
+                response_code,
+            )
+        return True
+    if _log.isEnabledFor(logging.ERROR):
+        _log.error(
+            "Action '%s' failed with response code %d: %s",
+            action_description,
+            response_code,
+            response.response_body_bytes[:_LOGGED_BODY_LIMIT].decode(
+                "utf-8", errors="replace"
+            ),
         )
-    if not response:
-        logging.error("Response is None")
-        return None
-    if not isinstance(response, dict):
-        logging.error("Response is not a dictionary")
-        return None
-    if not isinstance(response_code, int):
-        logging.error("Response code is not an integer")
-        return None
+    return False
@@ -1,28 +1,191 @@
 import typing
-import requests
+import httpx
 import logging
 import config
 import json
+import types
+import enum
+import functools
+import importlib.util
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import LRUCache, TTLCache
 
+try:
+    import orjson
 
-METHOD_GET = "http_get"
-METHOD_POST = "http_post"
-METHOD_PUT = "http_put"
-METHOD_DELETE = "http_delete"
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the same type
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# httpx needs the h2 package for HTTP/2
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+_log = logging.getLogger(__name__)
+
+
+class HttpMethod(enum.IntEnum):
+    """The HTTP methods supported by the API layer."""
+
+    GET = 1
+    POST = 2
+    PUT = 3
+    DELETE = 4
+
+
+METHOD_GET = HttpMethod.GET
+METHOD_POST = HttpMethod.POST
+METHOD_PUT = HttpMethod.PUT
+METHOD_DELETE = HttpMethod.DELETE
+
+_HTTP_VERB_MAP = {
+    METHOD_GET: "GET",
+    METHOD_POST: "POST",
+    METHOD_PUT: "PUT",
+    METHOD_DELETE: "DELETE",
+}
+_METHODS_WITH_BODY = frozenset((METHOD_POST, METHOD_PUT))
+
+# idempotent requests answered with these codes are retried with exponential backoff;
+# once retries run out the last response is returned as an ApiResponse, never raised
+_RETRY_METHODS = frozenset((METHOD_GET, METHOD_PUT, METHOD_DELETE))
+_RETRY_STATUSES = frozenset((429, 502, 503, 504))
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.2
+# keep-alive connections, also the cap on api_get_many workers
+_POOL_MAXSIZE = 20
+
+
+def _build_client() -> httpx.Client:
+    """
+    Builds the shared HTTP client so connections are reused across calls.
+    Uses HTTP/2 when the h2 package is installed, multiplexing requests over one connection.
+    Returns:
+        httpx.Client: The configured client.
+    """
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=_POOL_MAXSIZE)
+    return httpx.Client(
+        transport=httpx.HTTPTransport(http2=_HTTP2, limits=limits, retries=3),
+        timeout=httpx.Timeout(30.0, connect=3.05),
+        follow_redirects=True,  # requests' default, which callers rely on
+    )
+
+
+_CLIENT = _build_client()
+
+# config is static for the life of the process, so build these once
+_HEADERS = types.MappingProxyType(
+    {"api-key": config.API_KEY, "Content-Type": "application/json"}
+)
+_BASE = config.API_BASE_URL.rstrip("/") + "/"
+
+
+class CachePolicy(enum.IntEnum):
+    """Time-to-live policies, in seconds, for cached GET responses."""
+
+    NONE = 0
+    SHORT = 5
+    NORMAL = 30
+    LONG = 60
+
+
+# one bounded cache per policy since TTLCache has a single ttl; cachetools is not thread-safe
+_RESPONSE_CACHES = {
+    policy: TTLCache(maxsize=10_000, ttl=policy.value)
+    for policy in CachePolicy
+    if policy is not CachePolicy.NONE
+}
+# last response per endpoint that carried an ETag/Last-Modified, kept past its TTL for revalidation
+_VALIDATOR_CACHE = LRUCache(maxsize=10_000)
+_RESPONSE_CACHE_LOCK = threading.Lock()
 
 
 class ApiResponse:
     """A class to handle API responses."""
 
-    def __init__(self, response_code: int, response_body: str):
+    __slots__ = ("response_code", "response_body_bytes", "headers", "_json")
+
+    def __init__(
+        self,
+        response_code: int,
+        response_body: typing.Union[bytes, str],
+        headers: typing.Mapping[str, str] = None,
+    ):
         """
         Initializes the ApiResponse object.
         Args:
             response_code (int): The HTTP response code.
-            response_body (str): The HTTP response body.
+            response_body (typing.Union[bytes, str]): The raw HTTP response body.
+            headers (typing.Mapping[str, str]): The HTTP response headers.
         """
         self.response_code = response_code
-        self.response_body = response_body
+        if isinstance(response_body, str):
+            response_body = response_body.encode("utf-8")
+        self.response_body_bytes = response_body
+        self.headers = headers if headers is not None else {}
+        self._json = None
+
+    def copy(self) -> "ApiResponse":
+        """
+        Returns a new ApiResponse sharing the immutable body but not the decoded JSON,
+        so callers mutating one copy's data cannot affect another.
+        Returns:
+            ApiResponse: The copy.
+        """
+        return ApiResponse(self.response_code, self.response_body_bytes, self.headers)
+
+    @property
+    def text(self) -> str:
+        """
+        Returns the response body decoded as UTF-8 text.
+        Decoded on demand only; JSON parsing reads the raw bytes directly.
+        Returns:
+            str: The HTTP response body.
+        """
+        return self.response_body_bytes.decode("utf-8", errors="replace")
+
+    @property
+    def response_body(self) -> str:
+        """
+        Returns the response body decoded as text. Kept for compatibility, see text.
+        Returns:
+            str: The HTTP response body.
+        """
+        return self.text
+
+    @property
+    def json(self) -> dict:
+        """
+        Decodes the response body once and caches the result.
+        Returns:
+            dict: The decoded response body.
+        """
+        if self._json is None:
+            self._json = _loads(self.response_body_bytes)
+        return self._json
+
+    def iter_data(self) -> typing.Iterator:
+        """
+        Yields the records of the response's data array one at a time.
+        Uses ijson to stream-parse the body when installed, so the full list is never built.
+        Yields:
+            The records of the data array.
+        """
+        if ijson is None or self._json is not None:
+            yield from self.json["data"]  # depends on the API response structure
+            return
+        yield from ijson.items(
+            io.BytesIO(self.response_body_bytes), "data.item", use_float=True
+        )
 
     def as_paginated_response(self):
         """
@@ -31,18 +194,20 @@ class ApiResponse:
             dict: The paginated response.
         """
         try:
-            response = json.loads(self.response_body)
+            response = self.json
             if not response.get("current_page"):
                 return StdResponse(response)
             return PaginatedResponse(response)
         except json.JSONDecodeError as e:
-            logging.error(f"Failed to decode JSON: {e}")
+            _log.error("Failed to decode JSON: %s", e)
             raise
 
 
 class StdResponse:
     """A class to handle standard API responses."""
 
+    __slots__ = ("data",)
+
     def __init__(self, pr: dict):
         if not pr:
             raise ValueError("Response cannot be None")
@@ -52,6 +217,17 @@ class StdResponse:
 class PaginatedResponse:
     """A class to handle paginated API responses."""
 
+    __slots__ = (
+        "data",
+        "_page",
+        "_first_page",
+        "_last_page",
+        "_prev_page_url",
+        "_next_page_url",
+        "_first_url",
+        "_next_url",
+    )
+
     def __init__(self, pr: dict):
         if not pr:
             raise ValueError("Response cannot be None")
@@ -100,7 +276,7 @@ class PaginatedResponse:
         Returns:
             bool: True if there is a previous page, False otherwise.
         """
-        return self._page < self._first_page
+        return self._page > self._first_page
 
     def go_next_page(self):
         """
@@ -115,8 +291,7 @@ class PaginatedResponse:
             raise ValueError(
                 f"Failed to get next page: {r.response_code} - {r.response_body}"
             )
-        json_data = json.loads(r.response_body)
-        self._set_data_from_new_reponse(json_data)
+        self._set_data_from_new_reponse(r.json)
 
     def go_prev_page(self):
         """
@@ -131,8 +306,7 @@ class PaginatedResponse:
             raise ValueError(
                 f"Failed to get previous page: {r.response_code} - {r.response_body}"
             )
-        json_data = json.loads(r.response_body)
-        self._set_data_from_new_reponse(json_data)
+        self._set_data_from_new_reponse(r.json)
 
     def go_first_page(self):
         """
@@ -145,8 +319,7 @@ class PaginatedResponse:
             raise ValueError(
                 f"Failed to get first page: {r.response_code} - {r.response_body}"
             )
-        json_data = json.loads(r.response_body)
-        self._set_data_from_new_reponse(json_data)
+        self._set_data_from_new_reponse(r.json)
 
     def go_last_page(self):
         """
@@ -159,30 +332,85 @@ class PaginatedResponse:
             raise ValueError(
                 f"Failed to get last page: {r.response_code} - {r.response_body}"
             )
-        json_data = json.loads(r.response_body)
-        self._set_data_from_new_reponse(json_data)
+        self._set_data_from_new_reponse(r.json)
+
+    def iter_pages(self, prefetch: bool = False) -> typing.Iterator[typing.List]:
+        """
+        Yields the data of the current page and of every following page.
+        Each step advances this object as go_next_page() does.
+        Args:
+            prefetch (bool): Fetch the next page in a background thread while the caller
+                processes the current one.
+        Yields:
+            typing.List: The data of one page.
+        """
+        if not prefetch:
+            yield self.data
+            while self.has_next_page():
+                self.go_next_page()
+                yield self.data
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = (
+                executor.submit(api_get, self._next_page_url)
+                if self.has_next_page()
+                else None
+            )
+            yield self.data
+            while pending is not None:
+                r = pending.result()
+                if r.response_code != 200:
+                    raise ValueError(
+                        f"Failed to get next page: {r.response_code} - {r.response_body}"
+                    )
+                self._set_data_from_new_reponse(r.json)
+                pending = (
+                    executor.submit(api_get, self._next_page_url)
+                    if self.has_next_page()
+                    else None
+                )
+                yield self.data
+
+    async def aiter_pages(self) -> typing.AsyncIterator[typing.List]:
+        """
+        Asynchronously yields the data of the current page and of every following page.
+        Yields:
+            typing.List: The data of one page.
+        """
+        from src.api.cloud_api_async import api_get_async  # avoids a circular import
+
+        yield self.data
+        while self.has_next_page():
+            r = await api_get_async(self._next_page_url)
+            if r.response_code != 200:
+                raise ValueError(
+                    f"Failed to get next page: {r.response_code} - {r.response_body}"
+                )
+            self._set_data_from_new_reponse(r.json)
+            yield self.data
 
 
-def __get_headers() -> dict:
+def __get_headers() -> typing.Mapping[str, str]:
     """
     Returns the headers for the API request.
+    The mapping is shared and read-only; merge with {**headers, **overrides} to customise.
     Returns:
-        dict: The headers for the API request.
+        typing.Mapping[str, str]: The headers for the API request.
     """
-    headers = {}
-    headers["api-key"] = config.API_KEY
-    headers["Content-Type"] = "application/json"
-
-    return headers
+    return _HEADERS
 
 
 def __call_api(
-    method: str, url: str, headers: dict = None, payload: dict = None
+    method: HttpMethod,
+    url: str,
+    headers: typing.Mapping[str, str] = None,
+    payload: dict = None,
 ) -> ApiResponse:
     """
     Calls the API with the specified method, URL, headers, and payload.
     Args:
-        method (str): The HTTP method to use (GET, POST, PUT, DELETE).
+        method (HttpMethod): The HTTP method to use (GET, POST, PUT, DELETE).
         url (str): The URL to call.
         headers (dict): The headers for the request.
         payload (dict): The payload for the request.
@@ -190,49 +418,132 @@ def __call_api(
         ApiResponse: The response from the API.
     """
 
-    if method == METHOD_GET:
-        response = requests.get(url, headers=headers)
-    elif method == METHOD_POST:
-        response = requests.post(url, headers=headers, json=payload)
-    elif method == METHOD_PUT:
-        response = requests.put(url, headers=headers, json=payload)
-    elif method == METHOD_DELETE:
-        response = requests.delete(url, headers=headers)
-    else:
-        raise ValueError(f"Unsupported HTTP method: {method}")
+    verb = _HTTP_VERB_MAP.get(method)
+    if verb is None:
+        raise ValueError(f"Unsupported HTTP method: {method!r}")
+
+    json_payload = payload if method in _METHODS_WITH_BODY else None
+    retries = _MAX_RETRIES if method in _RETRY_METHODS else 0
+    for attempt in range(retries + 1):
+        response = _CLIENT.request(verb, url, headers=headers, json=json_payload)
+        if attempt == retries or response.status_code not in _RETRY_STATUSES:
+            break
+        time.sleep(_RETRY_BACKOFF * 2**attempt)
 
     response_code = response.status_code
-    response_text = response.text
+    response_content = response.content
 
-    logging.debug(
-        f"API call to {url} with method {method} returned status code {response.status_code}"
+    _log.debug(
+        "API call to %s with method %s returned status code %d",
+        url,
+        verb,
+        response_code,
     )
-    return ApiResponse(response_code, response_text)
+    return ApiResponse(response_code, response_content, response.headers)
 
 
+@functools.lru_cache(maxsize=512)
 def form_url_endpoint(endpoint: str) -> str:
     """
     Forms the full URL for the API endpoint.
+    Results are memoised since callers hit a small set of endpoints repeatedly.
     Args:
         endpoint (str): The API endpoint.
     Returns:
         str: The full URL for the API endpoint.
     """
-    return f"{config.API_BASE_URL}/{endpoint}"
+    return _BASE + endpoint
+
+
+def invalidate_cached_response(endpoint: str):
+    """
+    Drops any cached GET response for the endpoint.
+    Args:
+        endpoint (str): The API endpoint.
+    """
+    key = (endpoint,)
+    with _RESPONSE_CACHE_LOCK:
+        for cache in _RESPONSE_CACHES.values():
+            cache.pop(key, None)
+        _VALIDATOR_CACHE.pop(key, None)
+
+
+def clear_response_cache():
+    """
+    Drops every cached GET response.
+    """
+    with _RESPONSE_CACHE_LOCK:
+        for cache in _RESPONSE_CACHES.values():
+            cache.clear()
+        _VALIDATOR_CACHE.clear()
 
 
-def api_get(endpoint: str) -> ApiResponse:
+def api_get(
+    endpoint: str, cache_policy: CachePolicy = CachePolicy.NORMAL
+) -> ApiResponse:
     """
     Calls the API with the GET method.
+    Successful responses are cached for the policy's TTL and served without a request.
+    Once expired, responses carrying an ETag or Last-Modified are revalidated with a
+    conditional request, and a 304 reuses the cached body.
     Args:
         endpoint (str): The API endpoint.
-        headers (dict): The headers for the request.
+        cache_policy (CachePolicy): How long to cache the response; NONE bypasses the cache.
     Returns:
         ApiResponse: The response from the API.
     """
+    cache_policy = CachePolicy(cache_policy)  # also accepts the plain TTL, e.g. 0 or 30
     url = form_url_endpoint(endpoint)
     headers = __get_headers()
-    return __call_api(METHOD_GET, url, headers=headers)
+    if cache_policy is CachePolicy.NONE:
+        return __call_api(METHOD_GET, url, headers=headers)
+
+    cache = _RESPONSE_CACHES[cache_policy]
+    key = (endpoint,)  # extend with sorted query params if endpoints take them
+    with _RESPONSE_CACHE_LOCK:
+        cached = cache.get(key)
+        stale = _VALIDATOR_CACHE.get(key) if cached is None else None
+    # cache entries are never handed out directly, see ApiResponse.copy
+    if cached is not None:
+        return cached.copy()
+
+    if stale is not None:
+        headers = {**headers}
+        etag = stale.headers.get("ETag")
+        last_modified = stale.headers.get("Last-Modified")
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = __call_api(METHOD_GET, url, headers=headers)
+    if response.response_code == 304 and stale is not None:
+        with _RESPONSE_CACHE_LOCK:
+            cache[key] = stale
+        return stale.copy()
+    if 200 <= response.response_code < 300:
+        stored = response.copy()
+        with _RESPONSE_CACHE_LOCK:
+            cache[key] = stored
+            if stored.headers.get("ETag") or stored.headers.get("Last-Modified"):
+                _VALIDATOR_CACHE[key] = stored
+    return response
+
+
+def api_get_many(
+    endpoints: typing.List[str], max_workers: int = 10
+) -> typing.List[ApiResponse]:
+    """
+    Calls the API with the GET method for several endpoints concurrently.
+    Workers share the pooled client and are capped at its keep-alive pool size.
+    Args:
+        endpoints (typing.List[str]): The API endpoints.
+        max_workers (int): The maximum number of concurrent requests.
+    Returns:
+        typing.List[ApiResponse]: The responses, in the same order as endpoints.
+    """
+    with ThreadPoolExecutor(max_workers=min(max_workers, _POOL_MAXSIZE)) as executor:
+        return list(executor.map(api_get, endpoints))
 
 
 def api_post(endpoint: str, payload: dict) -> ApiResponse:
@@ -247,7 +558,11 @@ def api_post(endpoint: str, payload: dict) -> ApiResponse:
     """
     url = form_url_endpoint(endpoint)
     headers = __get_headers()
-    return __call_api(METHOD_POST, url, headers=headers, payload=payload)
+    try:
+        return __call_api(METHOD_POST, url, headers=headers, payload=payload)
+    finally:
+        # after the write, so a GET in flight meanwhile cannot re-cache the old body
+        invalidate_cached_response(endpoint)
 
 
 def api_put(endpoint: str, payload: dict) -> ApiResponse:
@@ -262,7 +577,11 @@ def api_put(endpoint: str, payload: dict) -> ApiResponse:
     """
     url = form_url_endpoint(endpoint)
     headers = __get_headers()
-    return __call_api(METHOD_PUT, url, headers=headers, payload=payload)
+    try:
+        return __call_api(METHOD_PUT, url, headers=headers, payload=payload)
+    finally:
+        # after the write, so a GET in flight meanwhile cannot re-cache the old body
+        invalidate_cached_response(endpoint)
 
 
 def api_delete(endpoint: str) -> ApiResponse:
@@ -276,4 +595,8 @@ def api_delete(endpoint: str) -> ApiResponse:
     """
     url = form_url_endpoint(endpoint)
     headers = __get_headers()
-    return __call_api(METHOD_DELETE, url, headers=headers)
+    try:
+        return __call_api(METHOD_DELETE, url, headers=headers)
+    finally:
+        # after the write, so a GET in flight meanwhile cannot re-cache the old body
+        invalidate_cached_response(endpoint)
@@ -0,0 +1,236 @@
+import typing
+import asyncio
+import logging
+import urllib.parse
+import weakref
+import aiohttp
+from src.api.cloud_api import (
+    METHOD_GET,
+    METHOD_POST,
+    METHOD_PUT,
+    METHOD_DELETE,
+    _HTTP_VERB_MAP,
+    _METHODS_WITH_BODY,
+    HttpMethod,
+    ApiResponse,
+    PaginatedResponse,
+    form_url_endpoint,
+    invalidate_cached_response,
+    __get_headers,
+)
+
+_log = logging.getLogger(__name__)
+
+# event loop -> (session, guard); a session can only be used and closed on its own loop
+_SESSIONS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+async def __session_guard(
+    loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession
+):
+    """
+    Closes the session when its event loop finalises async generators on shutdown,
+    which asyncio.run() does before closing the loop.
+    Args:
+        loop (asyncio.AbstractEventLoop): The loop the session belongs to.
+        session (aiohttp.ClientSession): The session to close.
+    """
+    try:
+        yield
+    finally:
+        # the session keeps a reference to its loop, so the weak key alone never expires
+        entry = _SESSIONS.get(loop)
+        if entry is not None and entry[0] is session:
+            del _SESSIONS[loop]
+        await session.close()
+
+
+async def __get_session() -> aiohttp.ClientSession:
+    """
+    Returns the aiohttp session of the running event loop, creating it on first use.
+    Returns:
+        aiohttp.ClientSession: The session for the running loop.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _SESSIONS.get(loop)
+    if entry is not None and not entry[0].closed:
+        return entry[0]
+
+    connector = aiohttp.TCPConnector(
+        limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=75
+    )
+    session = aiohttp.ClientSession(
+        connector=connector, timeout=aiohttp.ClientTimeout(total=30)
+    )
+    guard = __session_guard(loop, session)
+    await guard.__anext__()
+    _SESSIONS[loop] = (session, guard)
+    return session
+
+
+async def close_session():
+    """
+    Closes the aiohttp session of the running event loop.
+    Loops driven by asyncio.run() close it on their own; call this before closing any
+    other loop the async API was used on, or its connections are leaked.
+    """
+    entry = _SESSIONS.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[1].aclose()
+
+
+async def __call_api_async(
+    method: HttpMethod,
+    url: str,
+    headers: typing.Mapping[str, str] = None,
+    payload: dict = None,
+) -> ApiResponse:
+    """
+    Calls the API asynchronously with the specified method, URL, headers, and payload.
+    Args:
+        method (HttpMethod): The HTTP method to use (GET, POST, PUT, DELETE).
+        url (str): The URL to call.
+        headers (dict): The headers for the request.
+        payload (dict): The payload for the request.
+    Returns:
+        ApiResponse: The response from the API.
+    """
+    verb = _HTTP_VERB_MAP.get(method)
+    if verb is None:
+        raise ValueError(f"Unsupported HTTP method: {method!r}")
+
+    session = await __get_session()
+    async with session.request(
+        verb,
+        url,
+        headers=headers,
+        json=payload if method in _METHODS_WITH_BODY else None,
+    ) as response:
+        response_code = response.status
+        response_content = await response.read()
+        response_headers = response.headers
+
+    _log.debug(
+        "Async API call to %s with method %s returned status code %d",
+        url,
+        verb,
+        response_code,
+    )
+    return ApiResponse(response_code, response_content, response_headers)
+
+
+async def api_get_async(endpoint: str) -> ApiResponse:
+    """
+    Calls the API asynchronously with the GET method.
+    Args:
+        endpoint (str): The API endpoint.
+    Returns:
+        ApiResponse: The response from the API.
+    """
+    url = form_url_endpoint(endpoint)
+    headers = __get_headers()
+    return await __call_api_async(METHOD_GET, url, headers=headers)
+
+
+async def api_post_async(endpoint: str, payload: dict) -> ApiResponse:
+    """
+    Calls the API asynchronously with the POST method.
+    Args:
+        endpoint (str): The API endpoint.
+        payload (dict): The payload for the request.
+    Returns:
+        ApiResponse: The response from the API.
+    """
+    url = form_url_endpoint(endpoint)
+    headers = __get_headers()
+    try:
+        return await __call_api_async(
+            METHOD_POST, url, headers=headers, payload=payload
+        )
+    finally:
+        # keeps the sync api_get response cache consistent with async writes
+        invalidate_cached_response(endpoint)
+
+
+async def api_put_async(endpoint: str, payload: dict) -> ApiResponse:
+    """
+    Calls the API asynchronously with the PUT method.
+    Args:
+        endpoint (str): The API endpoint.
+        payload (dict): The payload for the request.
+    Returns:
+        ApiResponse: The response from the API.
+    """
+    url = form_url_endpoint(endpoint)
+    headers = __get_headers()
+    try:
+        return await __call_api_async(METHOD_PUT, url, headers=headers, payload=payload)
+    finally:
+        # keeps the sync api_get response cache consistent with async writes
+        invalidate_cached_response(endpoint)
+
+
+async def api_delete_async(endpoint: str) -> ApiResponse:
+    """
+    Calls the API asynchronously with the DELETE method.
+    Args:
+        endpoint (str): The API endpoint.
+    Returns:
+        ApiResponse: The response from the API.
+    """
+    url = form_url_endpoint(endpoint)
+    headers = __get_headers()
+    try:
+        return await __call_api_async(METHOD_DELETE, url, headers=headers)
+    finally:
+        # keeps the sync api_get response cache consistent with async writes
+        invalidate_cached_response(endpoint)
+
+
+def _page_url(first_url: str, page: int) -> str:
+    """
+    Builds the URL of a given page from the first page URL.
+    Args:
+        first_url (str): The URL of the first page.
+        page (int): The page number.
+    Returns:
+        str: The URL of the requested page.
+    """
+    # depends on the API response structure
+    parts = urllib.parse.urlsplit(first_url)
+    query = dict(urllib.parse.parse_qsl(parts.query))
+    query["page"] = str(page)
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+
+async def iter_all_pages(
+    pr: PaginatedResponse, concurrency: int = 8
+) -> typing.List[typing.List]:
+    """
+    Fetches the remaining pages of a paginated response concurrently.
+    Args:
+        pr (PaginatedResponse): The paginated response to walk from.
+        concurrency (int): The maximum number of in-flight requests.
+    Returns:
+        typing.List[typing.List]: The data of every page from the current one to the last, in order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(url: str) -> ApiResponse:
+        async with semaphore:
+            return await api_get_async(url)
+
+    urls = [
+        _page_url(pr._first_url, page)
+        for page in range(pr._page + 1, pr._last_page + 1)
+    ]
+    responses = await asyncio.gather(*[fetch(url) for url in urls])
+
+    pages = [pr.data]
+    for r in responses:
+        if r.response_code != 200:
+            raise ValueError(
+                f"Failed to get page: {r.response_code} - {r.response_body}"
+            )
+        pages.append(r.as_paginated_response().data)
+    return pages
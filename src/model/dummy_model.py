@@ -11,13 +11,30 @@ class DummyModel:
     name: str = "DummyModel"
     version: str = "1.0"
 
+    def __post_init__(self):
+        """
+        Builds the fixed responses once, since they only depend on name and version.
+        """
+        self._build_responses()
+
+    def _build_responses(self):
+        """
+        Formats the predict and train responses, remembering the name and version used.
+        """
+        self._built_name = self.name
+        self._built_version = self.version
+        self._predict_response = f"Prediction from {self.name} (version {self.version})"
+        self._train_response = f"Training completed on {self.name} with provided data."
+
     def predict(self, input_data):
         """
         A dummy prediction method that returns a fixed response.
         :param input_data: The input data for prediction.
         :return: A fixed response indicating the prediction.
         """
-        return f"Prediction from {self.name} (version {self.version})"
+        if self._built_name is not self.name or self._built_version is not self.version:
+            self._build_responses()
+        return self._predict_response
 
     def train(self, training_data):
         """
@@ -25,4 +42,6 @@ class DummyModel:
         :param training_data: The data to train on.
         :return: A fixed response indicating the training completion.
         """
-        return f"Training completed on {self.name} with provided data."
+        if self._built_name is not self.name or self._built_version is not self.version:
+            self._build_responses()
+        return self._train_response